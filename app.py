@@ -5,9 +5,13 @@ import time
 import argparse
 import logging
 import platform
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import FrozenSet, Optional, Tuple
 
-from file_monitor import scan_downloads_folder, load_from_csv, update_csv_data, save_to_csv, get_system_info
+from file_monitor import (scan_downloads_folder, load_from_csv, update_csv_data, save_to_csv, get_system_info,
+                          records_unchanged, get_folder_signature, get_scan_signature)
 from file_organizer import organize_downloads_folder
 from config_manager import get_config, ConfigManager
 
@@ -18,6 +22,16 @@ try:
 except ImportError:
     EXTENSIONS_AVAILABLE = False
 
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+# (argparse attribute, config key) pairs copied into the config when given on the command line
+CLI_OVERRIDES = (
+    ("log_level", "logging.level"),
+    ("log_file", "logging.file"),
+    ("downloads_path", "downloads_path"),
+    ("csv_path", "csv_path"),
+)
+
 
 def setup_logging(config: ConfigManager) -> logging.Logger:
     log_level = config.get("logging.level", "INFO")
@@ -59,6 +73,9 @@ class DownloadsMonitor:
         self.enable_extensions = self.config.get("monitoring.enable_extensions", True) and EXTENSIONS_AVAILABLE
         self.extension_manager = None
         self.duplicate_detector = None
+        self._hash_executor: Optional[ThreadPoolExecutor] = None
+        # False when the last cycle left a move or hash failed, so it must be retried
+        self.cycle_complete = False
         
         if self.enable_extensions:
             try:
@@ -92,6 +109,33 @@ class DownloadsMonitor:
             self.logger.info(f"{key}: {value}")
         self.logger.info(f"Extensions enabled: {self.enable_extensions}")
     
+    def _get_hash_executor(self) -> Optional[ThreadPoolExecutor]:
+        """Hashing pool shared by every cycle, so continuous mode doesn't respawn threads"""
+        hash_workers = self.config.get("performance.hash_workers", 4)
+        if self._hash_executor is None and hash_workers > 1:
+            self._hash_executor = ThreadPoolExecutor(max_workers=hash_workers, thread_name_prefix="sha1")
+        return self._hash_executor
+    
+    def close(self) -> None:
+        if self._hash_executor:
+            self._hash_executor.shutdown()
+            self._hash_executor = None
+    
+    def folder_signature(self) -> Optional[FrozenSet[Tuple[str, int, int]]]:
+        """Snapshot of the tracked files, or None when a full cycle must run regardless"""
+        if not Path(self.csv_path).exists():
+            return None
+        try:
+            return get_folder_signature(self.downloads_path, self.config.get_excluded_files(),
+                                        list(self.config.get_categories().keys()))
+        except OSError as e:
+            self.logger.debug(f"Could not snapshot Downloads folder: {e}")
+            return None
+    
+    def scanned_signature(self) -> FrozenSet[Tuple[str, int, int]]:
+        """Snapshot of what the last scan recorded, comparable with folder_signature()"""
+        return get_scan_signature(self.new_data)
+    
     def scan_folder(self) -> bool:
         self.logger.info("Scanning Downloads folder...")
         incremental = self.config.get("monitoring.incremental_scan", True)
@@ -103,7 +147,8 @@ class DownloadsMonitor:
             max_file_size_mb=self.config.get("performance.max_file_size_for_sha1_mb", 500),
             show_progress=self.logger.isEnabledFor(logging.INFO),
             existing_data=self.existing_data if incremental else None,
-            incremental=incremental
+            incremental=incremental,
+            executor=self._get_hash_executor()
         )
         self.logger.info(f"Files scanned: {len(self.new_data)}")
         return bool(self.new_data)
@@ -112,6 +157,9 @@ class DownloadsMonitor:
         self.logger.info("Updating data...")
         self.updated_data = update_csv_data(self.existing_data, self.new_data, self.config.get_excluded_files())
         self.logger.info(f"Updated records: {len(self.updated_data)}")
+        if records_unchanged(self.existing_data, self.updated_data):
+            self.logger.info("No changes since last scan, CSV left as is")
+            return True
         self.logger.info("Saving data to CSV...")
         return save_to_csv(self.updated_data, self.csv_path)
     
@@ -133,10 +181,7 @@ class DownloadsMonitor:
         self.logger.info(f"Downloads path: {self.downloads_path}")
         self.logger.info(f"Total files: {len(self.updated_data)}")
         
-        folder_stats = {}
-        for item in self.updated_data:
-            folder = item["folder_name"] if item["folder_name"] else "Root Directory"
-            folder_stats[folder] = folder_stats.get(folder, 0) + 1
+        folder_stats = Counter(item["folder_name"] or "Root Directory" for item in self.updated_data)
         
         self.logger.info("By folder distribution:")
         for folder, count in sorted(folder_stats.items()):
@@ -144,6 +189,8 @@ class DownloadsMonitor:
     
     def run_monitoring_cycle(self) -> bool:
         self.logger.info("Starting Downloads folder monitoring...")
+        self.cycle_complete = False
+        organize_errors = 0
         
         if not self.initialize():
             return False
@@ -157,6 +204,7 @@ class DownloadsMonitor:
                 smart_rules=self.config.get_smart_rules()
             )
             self.logger.info(f"Organization stats: {stats}")
+            organize_errors = stats["errors"]
         
         if not self.scan_folder():
             self.logger.warning("No files scanned")
@@ -167,6 +215,9 @@ class DownloadsMonitor:
         
         self.run_extensions()
         self.display_statistics()
+        hash_failed = (self.config.get("monitoring.calculate_sha1", True)
+                       and any(item["sha1"] is None for item in self.new_data))
+        self.cycle_complete = not organize_errors and not hash_failed
         self.logger.info("Monitoring completed!")
         return True
 
@@ -185,24 +236,41 @@ class ContinuousMonitor:
         self.logger.info(f"Starting continuous monitoring (interval: {self.interval}s)")
         
         try:
+            # Schedule cycles on a fixed monotonic grid so cycle duration doesn't drift the interval
+            next_run = time.monotonic()
+            last_signature = None
             while self.is_running:
-                self.logger.info("Running monitoring cycle...")
-                if not self.monitor.run_monitoring_cycle():
-                    self.logger.warning("Monitoring cycle failed, continuing...")
-                self.logger.info(f"Waiting {self.interval} seconds until next cycle...")
-                time.sleep(self.interval)
+                if last_signature is not None and self.monitor.folder_signature() == last_signature:
+                    self.logger.info("No changes in Downloads folder, skipping cycle")
+                else:
+                    self.logger.info("Running monitoring cycle...")
+                    if self.monitor.run_monitoring_cycle():
+                        # Built from the scan itself, so files arriving after it still trigger the next cycle;
+                        # left unset after a failed move or hash so the next interval retries it
+                        last_signature = self.monitor.scanned_signature() if self.monitor.cycle_complete else None
+                    else:
+                        last_signature = None
+                        self.logger.warning("Monitoring cycle failed, continuing...")
+                next_run += self.interval
+                delay = next_run - time.monotonic()
+                if delay < 0:
+                    # Cycle overran the interval; start the next one now instead of catching up
+                    next_run, delay = time.monotonic(), 0
+                self.logger.info(f"Waiting {delay:.0f} seconds until next cycle...")
+                time.sleep(delay)
         except KeyboardInterrupt:
             self.logger.info("Continuous monitoring stopped by user")
         except Exception as e:
             self.logger.error(f"Error in continuous monitoring: {e}")
         finally:
             self.is_running = False
+            self.monitor.close()
 
 
 def show_system_info() -> None:
-    print("=== System Information ===")
-    for key, value in get_system_info().items():
-        print(f"{key}: {value}")
+    lines = ["=== System Information ==="]
+    lines.extend(f"{key}: {value}" for key, value in get_system_info().items())
+    print("\n".join(lines))
 
 
 def show_cleanup_suggestions(config: ConfigManager) -> bool:
@@ -226,17 +294,21 @@ def show_cleanup_suggestions(config: ConfigManager) -> bool:
         suggestions = detector.suggest_cleanup()
         
         logger.info("=== Cleanup Suggestions ===")
-        delete_count = sum(1 for s in suggestions if s["action"] == "delete")
-        keep_count = sum(1 for s in suggestions if s["action"] == "keep")
+        to_delete = []
+        keep_count = 0
+        for s in suggestions:
+            if s["action"] == "delete":
+                to_delete.append(s)
+            elif s["action"] == "keep":
+                keep_count += 1
         
-        logger.info(f"Files to keep: {keep_count}, Files to delete: {delete_count}")
+        logger.info(f"Files to keep: {keep_count}, Files to delete: {len(to_delete)}")
         
-        if delete_count > 0:
+        if to_delete:
             logger.info("Files suggested for deletion:")
-            for s in suggestions:
-                if s["action"] == "delete":
-                    f = s["file"]
-                    logger.info(f"  {f.get('folder_name', '~')}/{f.get('filename', 'unknown')} - {s['reason']}")
+            for s in to_delete:
+                f = s["file"]
+                logger.info(f"  {f.get('folder_name', '~')}/{f.get('filename', 'unknown')} - {s['reason']}")
         return True
     except Exception as e:
         logger.error(f"Error analyzing cleanup suggestions: {e}")
@@ -287,7 +359,7 @@ def create_argument_parser() -> argparse.ArgumentParser:
     parser.add_argument("--downloads-path", type=str, help="Override Downloads folder path")
     parser.add_argument("--csv-path", type=str, help="Override CSV output file path")
     parser.add_argument("--config", type=str, default="config.json", help="Path to configuration file")
-    parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Set logging level")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, help="Set logging level")
     parser.add_argument("--log-file", type=str, help="Write logs to file")
     parser.add_argument("--info", "-i", action="store_true", help="Show system information")
     parser.add_argument("--cleanup", action="store_true", help="Show cleanup suggestions")
@@ -302,14 +374,10 @@ def main() -> int:
     config = ConfigManager(args.config)
     
     # Override config with command line arguments
-    if args.log_level:
-        config.set("logging.level", args.log_level)
-    if args.log_file:
-        config.set("logging.file", args.log_file)
-    if args.downloads_path:
-        config.set("downloads_path", args.downloads_path)
-    if args.csv_path:
-        config.set("csv_path", args.csv_path)
+    for arg_name, key_path in CLI_OVERRIDES:
+        value = getattr(args, arg_name)
+        if value:
+            config.set(key_path, value)
     if args.no_ext:
         config.set("monitoring.enable_extensions", False)
     
@@ -330,7 +398,11 @@ def main() -> int:
             ContinuousMonitor(monitor, args.continuous).start()
             return 0
         else:
-            return 0 if DownloadsMonitor(config).run_monitoring_cycle() else 1
+            monitor = DownloadsMonitor(config)
+            try:
+                return 0 if monitor.run_monitoring_cycle() else 1
+            finally:
+                monitor.close()
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
         return 0
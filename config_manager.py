@@ -3,6 +3,8 @@
 
 import json
 import logging
+import os
+import stat
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
@@ -41,7 +43,7 @@ class ConfigManager:
                 {"pattern": "*portable*", "category": "Programs"}
             ]
         },
-        "performance": {"max_file_size_for_sha1_mb": 500, "chunk_size_bytes": 32768},
+        "performance": {"max_file_size_for_sha1_mb": 500, "chunk_size_bytes": 32768, "hash_workers": 4},
         "logging": {"level": "INFO", "file": None, "console": True}
     }
 
@@ -49,6 +51,7 @@ class ConfigManager:
         self.config_path = config_path
         self.logger = logging.getLogger(__name__)
         self.config = self._load_config()
+        self._downloads_path: Optional[str] = None
 
     def _load_config(self) -> Dict[str, Any]:
         config_path = Path(self.config_path)
@@ -106,8 +109,16 @@ class ConfigManager:
         for key in keys[:-1]:
             config = config.setdefault(key, {})
         config[keys[-1]] = value
+        if keys[0] == "downloads_path":
+            self._downloads_path = None
 
     def get_downloads_path(self) -> str:
+        # Resolved once per setting; avoids a stat and a registry read on every CSV load/save
+        if self._downloads_path is None:
+            self._downloads_path = self._resolve_downloads_path()
+        return self._downloads_path
+
+    def _resolve_downloads_path(self) -> str:
         config_path = self.get("downloads_path")
         if config_path and Path(config_path).exists():
             return config_path
@@ -147,11 +158,18 @@ class ConfigManager:
                 errors.append("max_file_size_for_sha1_mb must be at least 1")
             if perf.get("chunk_size_bytes", 32768) < 1024:
                 errors.append("chunk_size_bytes should be at least 1024")
+            if perf.get("hash_workers", 4) < 1:
+                errors.append("hash_workers must be at least 1")
             if config.get("monitoring", {}).get("interval_seconds", 60) < 5:
                 errors.append("interval_seconds should be at least 5")
             downloads_path = config.get("downloads_path")
-            if downloads_path and not Path(downloads_path).exists():
-                errors.append(f"downloads_path does not exist: {downloads_path}")
+            if downloads_path:
+                # One stat answers both "exists" and "is a directory"
+                try:
+                    if not stat.S_ISDIR(os.stat(downloads_path).st_mode):
+                        errors.append(f"downloads_path is not a directory: {downloads_path}")
+                except OSError:
+                    errors.append(f"downloads_path does not exist: {downloads_path}")
         except Exception as e:
             errors.append(f"Validation error: {e}")
         return errors
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Duplicate file detection module"""
 
+import heapq
 import logging
 from pathlib import Path
 from typing import Dict, List, Any
@@ -33,12 +34,14 @@ class DuplicateDetector:
                 self.duplicates[sha1] = files
                 self.total_duplicates += len(files) - 1
                 
-                if files[0].get("full_path"):
+                file_size = files[0].get("size")
+                if file_size is None and files[0].get("full_path"):
                     try:
                         file_size = Path(files[0]["full_path"]).stat().st_size
-                        self.wasted_space += file_size * (len(files) - 1)
                     except (OSError, FileNotFoundError):
                         pass
+                if file_size is not None:
+                    self.wasted_space += file_size * (len(files) - 1)
         
         return self.duplicates
     
@@ -53,9 +56,9 @@ class DuplicateDetector:
         self.logger.info(f"Wasted space: {self.wasted_space / (1024 * 1024):.1f} MB")
         
         self.logger.info("Top duplicate groups:")
-        sorted_groups = sorted(self.duplicates.items(), key=lambda x: len(x[1]), reverse=True)
+        top_groups = heapq.nlargest(max_groups, self.duplicates.items(), key=lambda x: len(x[1]))
         
-        for i, (sha1, files) in enumerate(sorted_groups[:max_groups]):
+        for i, (sha1, files) in enumerate(top_groups):
             self.logger.info(f"  Group {i+1} ({len(files)} files):")
             for f in files:
                 self.logger.info(f"    {f.get('folder_name', '~')}/{f.get('filename', 'unknown')}")
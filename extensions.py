@@ -2,15 +2,32 @@
 """Extensions module for Downloads folder monitoring tool"""
 
 import logging
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+def format_size(size_bytes: int) -> str:
+    """Human-readable size; the unit comes from the bit length instead of repeated division."""
+    unit = min(len(_SIZE_UNITS) - 1, max(0, (int(size_bytes).bit_length() - 1) // 10))
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
+
+
+def _file_extension(filename: str) -> str:
+    """Lowercased suffix, same as Path(filename).suffix.lower() without building a Path."""
+    head, dot, ext = filename.rpartition(".")
+    if not head or not ext:
+        return ""
+    return "." + (ext if ext.islower() else ext.lower())
+
 
 class FileTypeAnalyzer:
     """Analyze file types in Downloads folder"""
     
     def __init__(self):
-        self.file_types: Dict[str, int] = {}
+        self.file_types: Counter = Counter()
         self.total_files: int = 0
         self.logger = logging.getLogger(__name__)
     
@@ -18,11 +35,8 @@ class FileTypeAnalyzer:
         self.file_types.clear()
         self.total_files = len(files_data)
         
-        for file_info in files_data:
-            filename = file_info.get("filename", "")
-            if filename:
-                ext = Path(filename).suffix.lower() or "No Extension"
-                self.file_types[ext] = self.file_types.get(ext, 0) + 1
+        filenames = (file_info.get("filename", "") for file_info in files_data)
+        self.file_types.update(_file_extension(filename) or "No Extension" for filename in filenames if filename)
     
     def display_statistics(self) -> None:
         self.logger.info("=== File Type Analysis ===")
@@ -30,8 +44,7 @@ class FileTypeAnalyzer:
         
         if self.file_types:
             self.logger.info("File type distribution:")
-            sorted_types = sorted(self.file_types.items(), key=lambda x: x[1], reverse=True)
-            for ext, count in sorted_types[:10]:
+            for ext, count in self.file_types.most_common(10):
                 percentage = (count / self.total_files) * 100
                 self.logger.info(f"  {ext}: {count} files ({percentage:.1f}%)")
 
@@ -58,33 +71,25 @@ class FileSizeAnalyzer:
         self.total_size = 0
 
         for file_info in files_data:
-            file_path = file_info.get("full_path")
-            if not file_path:
-                continue
-            try:
-                file_size = Path(file_path).stat().st_size
-                self.total_size += file_size
-                for cat_name, threshold in self.SIZE_CATEGORIES:
-                    if file_size < threshold:
-                        self.size_counts[cat_name] += 1
-                        break
-            except OSError:
-                continue
+            # Scanned records carry their size; records loaded from CSV need a stat
+            file_size = file_info.get("size")
+            if file_size is None:
+                file_path = file_info.get("full_path")
+                if not file_path:
+                    continue
+                try:
+                    file_size = Path(file_path).stat().st_size
+                except OSError:
+                    continue
+            self.total_size += file_size
+            for cat_name, threshold in self.SIZE_CATEGORIES:
+                if file_size < threshold:
+                    self.size_counts[cat_name] += 1
+                    break
 
     def display_statistics(self) -> None:
         self.logger.info("=== File Size Analysis ===")
-        
-        # Format size
-        size = float(self.total_size)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024.0:
-                size_str = f"{size:.1f} {unit}"
-                break
-            size /= 1024.0
-        else:
-            size_str = f"{size:.1f} PB"
-        
-        self.logger.info(f"Total size: {size_str}, Total files: {sum(self.size_counts.values())}")
+        self.logger.info(f"Total size: {format_size(self.total_size)}, Total files: {sum(self.size_counts.values())}")
         self.logger.info("Size distribution:")
         for category, count in self.size_counts.items():
             if count > 0:
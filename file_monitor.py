@@ -4,22 +4,46 @@
 import csv
 import hashlib
 import logging
+import os
 import platform
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet, Iterator, Tuple
 
+from config_manager import get_config
 
-def calculate_sha1(file_path: str, chunk_size: int = 8192, max_size_mb: Optional[int] = None) -> Optional[str]:
-    """Calculate SHA1 hash value of a file with optimized performance."""
+try:
+    from progress_tracker import create_progress_tracker
+    PROGRESS_AVAILABLE = True
+except ImportError:
+    PROGRESS_AVAILABLE = False
+
+CSV_FIELDNAMES = ("path", "rel_path", "folder_name", "filename", "sha1sum", "timestamp", "mtime_iso")
+# Used by the scan and the folder signature when the config leaves these empty
+DEFAULT_EXCLUDED_FILES = ["results.csv", "desktop.ini", "Thumbs.db", ".DS_Store"]
+DEFAULT_CATEGORY_FOLDERS = ["Programs", "Documents", "Pictures", "Videos", "Compressed", "Music"]
+# Columns load_from_csv pulls out of each row, in unpacking order
+_CSV_READ_FIELDS = ("path", "folder_name", "filename", "rel_path", "sha1sum", "mtime_iso", "timestamp")
+
+# Last parsed CSV, keyed by (csv path, downloads path, mtime_ns, size) of the file it came from
+_csv_cache: Dict[str, Any] = {"key": None, "rows": None}
+
+
+def calculate_sha1(file_path: str, chunk_size: int = 8192, max_size_mb: Optional[int] = None,
+                   file_size: Optional[int] = None) -> Optional[str]:
+    """Calculate SHA1 hash value of a file with optimized performance.
+    
+    Pass file_size when the caller already has it to skip the stat.
+    """
     logger = logging.getLogger(__name__)
     path = Path(file_path)
 
     try:
-        if not path.exists():
-            return None
-
-        file_size = path.stat().st_size
+        if file_size is None:
+            file_size = path.stat().st_size
         
         if max_size_mb is not None and file_size > max_size_mb * 1024 * 1024:
             logger.debug(f"Skipping SHA1 for large file: {file_path} ({file_size / 1024 / 1024:.1f} MB)")
@@ -38,6 +62,8 @@ def calculate_sha1(file_path: str, chunk_size: int = 8192, max_size_mb: Optional
         
         return sha1_hash.hexdigest()
 
+    except FileNotFoundError:
+        return None
     except PermissionError:
         logger.warning(f"Permission denied: {file_path}")
         return None
@@ -46,33 +72,86 @@ def calculate_sha1(file_path: str, chunk_size: int = 8192, max_size_mb: Optional
         return None
 
 
-def get_file_timestamp(file_path: str) -> Optional[str]:
-    """Get the last modification timestamp of a file in ISO8601 format."""
-    try:
-        path = Path(file_path)
-        if not path.exists():
-            return None
-        return datetime.fromtimestamp(path.stat().st_mtime).strftime("%Y-%m-%dT%H:%M:%S")
-    except Exception as e:
-        logging.getLogger(__name__).error(f"Error getting timestamp for {file_path}: {e}")
-        return None
+@lru_cache(maxsize=8192)
+def _iso_from_epoch(seconds: int) -> str:
+    """Format a whole-second epoch timestamp; files saved together share the same second."""
+    return datetime.fromtimestamp(seconds).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def iter_downloads_files(path: Path, excluded_files: List[str],
+                         category_folders: List[str]) -> Iterator[Tuple[os.DirEntry, str]]:
+    """Yield (entry, folder_name) for every tracked file under the Downloads folder.
+
+    Category folders are only tracked one level deep; files anywhere else are
+    reported under the root directory ('~').
+    """
+    logger = logging.getLogger(__name__)
+    root = str(path)
+    # (directory, folder_name, descend into subdirectories)
+    pending = [(root, '~', True)]
+
+    while pending:
+        dir_path, folder_name, descend = pending.pop()
+        try:
+            it = os.scandir(dir_path)
+        except PermissionError:
+            if dir_path == root:
+                raise
+            logger.warning(f"Permission denied accessing: {dir_path}")
+            continue
+
+        subdirs = []
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not descend:
+                        continue
+                    if dir_path == root and entry.name in category_folders:
+                        subdirs.append((entry.path, entry.name, False))
+                    else:
+                        subdirs.append((entry.path, folder_name, True))
+                elif entry.is_file() and entry.name not in excluded_files:
+                    yield entry, folder_name
+        # Reversed so subdirectories are visited in listing order (depth-first, like rglob)
+        pending.extend(reversed(subdirs))
+
+
+def get_folder_signature(downloads_path: str, excluded_files: List[str],
+                         category_folders: List[str]) -> FrozenSet[Tuple[str, int, int]]:
+    """Snapshot (path, size, mtime_ns) of every tracked file from a single directory walk.
+    
+    On Windows scandir returns size and mtime with the listing, so no file is opened.
+    """
+    return frozenset(
+        (entry.path, st.st_size, st.st_mtime_ns)
+        for entry, _ in iter_downloads_files(Path(downloads_path), excluded_files or DEFAULT_EXCLUDED_FILES,
+                                             category_folders or DEFAULT_CATEGORY_FOLDERS)
+        for st in (entry.stat(),)
+    )
+
+
+def get_scan_signature(files_info: List[Dict[str, Any]]) -> FrozenSet[Tuple[str, int, int]]:
+    """The get_folder_signature snapshot of exactly the files a scan recorded, from the scan's own stats."""
+    return frozenset((item["full_path"], item["size"], item["mtime_ns"]) for item in files_info)
 
 
 def scan_downloads_folder(downloads_path: Optional[str] = None, excluded_files: Optional[List[str]] = None,
                           category_folders: Optional[List[str]] = None, calculate_sha1_enabled: bool = True,
                           max_file_size_mb: Optional[int] = None, show_progress: bool = False,
                           existing_data: Optional[List[Dict[str, Any]]] = None, 
-                          incremental: bool = False) -> List[Dict[str, Any]]:
+                          incremental: bool = False, hash_workers: int = 1,
+                          executor: Optional[Executor] = None) -> List[Dict[str, Any]]:
     """Scan Downloads folder to get information about all files.
     
     Args:
         incremental: If True, only recalculate SHA1 for new/modified files
         existing_data: Previous scan data for incremental comparison
+        hash_workers: Number of threads hashing new/modified files
+        executor: Reusable pool for hashing; overrides hash_workers when given
     """
     logger = logging.getLogger(__name__)
 
     if downloads_path is None:
-        from config_manager import get_config
         downloads_path = get_config().get_downloads_path()
     
     path = Path(downloads_path)
@@ -80,8 +159,8 @@ def scan_downloads_folder(downloads_path: Optional[str] = None, excluded_files:
         logger.error(f"Downloads folder doesn't exist: {path}")
         return []
 
-    excluded_files = excluded_files or ["results.csv", "desktop.ini", "Thumbs.db", ".DS_Store"]
-    category_folders = category_folders or ["Programs", "Documents", "Pictures", "Videos", "Compressed", "Music"]
+    excluded_files = excluded_files or DEFAULT_EXCLUDED_FILES
+    category_folders = category_folders or DEFAULT_CATEGORY_FOLDERS
 
     # Build index from existing data for incremental scan
     existing_index: Dict[str, Dict[str, Any]] = {}
@@ -94,64 +173,77 @@ def scan_downloads_folder(downloads_path: Optional[str] = None, excluded_files:
     files_info = []
     progress_tracker = None
     skipped_count = 0
+    scan_errors = []
     
     try:
-        # Collect all valid files
-        all_files = []
-        for item_path in path.rglob('*'):
-            if not item_path.is_file() or item_path.name in excluded_files:
-                continue
-            
-            try:
-                relative_path = item_path.relative_to(path)
-                if len(relative_path.parts) > 2 and relative_path.parts[0] in category_folders:
-                    continue
-                folder_name = relative_path.parts[0] if len(relative_path.parts) > 1 and relative_path.parts[0] in category_folders else '~'
-                all_files.append((item_path, folder_name))
-            except ValueError:
-                continue
+        all_files = iter_downloads_files(path, excluded_files, category_folders)
         
-        if show_progress and logger.isEnabledFor(logging.INFO):
-            try:
-                from progress_tracker import create_progress_tracker
-                progress_tracker = create_progress_tracker(len(all_files), "Scanning files")
-            except ImportError:
-                pass
+        if show_progress and PROGRESS_AVAILABLE and logger.isEnabledFor(logging.INFO):
+            # The progress bar needs the total up front, so only materialize the listing here
+            all_files = list(all_files)
+            progress_tracker = create_progress_tracker(len(all_files), "Scanning files")
         
-        # Process files
-        for item_path, folder_name in all_files:
+        # Process files: reuse SHA1 of unchanged files, queue the rest for hashing
+        to_hash = []
+        for entry, folder_name in all_files:
+            item_path = Path(entry.path)
             try:
                 file_key = f"{folder_name}/{item_path.name}"
-                current_timestamp = get_file_timestamp(str(item_path))
-                
-                # Incremental scan: reuse SHA1 if file unchanged
-                sha1 = None
-                if calculate_sha1_enabled:
-                    if incremental and file_key in existing_index:
-                        existing = existing_index[file_key]
-                        # File unchanged if timestamp matches
-                        if existing.get("timestamp") == current_timestamp and existing.get("sha1"):
-                            sha1 = existing["sha1"]
-                            skipped_count += 1
-                        else:
-                            sha1 = calculate_sha1(str(item_path), max_size_mb=max_file_size_mb)
-                    else:
-                        sha1 = calculate_sha1(str(item_path), max_size_mb=max_file_size_mb)
-                
-                files_info.append({
+                # One stat per file, served from the directory listing on Windows;
+                # the size is kept so hashing and analyzers don't stat again
+                st = entry.stat()
+                current_timestamp = _iso_from_epoch(int(st.st_mtime))
+                file_info = {
                     "root_dir": "~",
                     "folder_name": folder_name,
                     "filename": item_path.name,
                     "full_path": str(item_path),
-                    "sha1": sha1,
+                    "sha1": None,
                     "timestamp": current_timestamp,
-                })
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                }
+                
+                needs_hash = False
+                if calculate_sha1_enabled:
+                    existing = existing_index.get(file_key)
+                    # Incremental scan: file unchanged if timestamp matches
+                    if existing and existing.get("timestamp") == current_timestamp and existing.get("sha1"):
+                        file_info["sha1"] = existing["sha1"]
+                        skipped_count += 1
+                    else:
+                        needs_hash = True
+                
+                files_info.append(file_info)
+                if needs_hash:
+                    to_hash.append(file_info)
+                    continue
             except Exception as e:
-                logger.error(f"Error creating file info for {item_path}: {e}")
+                # Reported once after the loop, so an unreadable folder doesn't flood the log
+                scan_errors.append(f"{item_path}: {e}")
             
             if progress_tracker:
                 progress_tracker.update(1, item_path.name)
         
+        if to_hash:
+            def hash_file(file_info: Dict[str, Any]) -> Optional[str]:
+                return calculate_sha1(file_info["full_path"], max_size_mb=max_file_size_mb,
+                                      file_size=file_info["size"])
+            
+            # hashlib releases the GIL on large buffers, so worker threads hash in parallel
+            own_executor = executor is None and hash_workers > 1
+            if own_executor:
+                executor = ThreadPoolExecutor(max_workers=hash_workers)
+            try:
+                hashes = executor.map(hash_file, to_hash) if executor else map(hash_file, to_hash)
+                for file_info, sha1 in zip(to_hash, hashes):
+                    file_info["sha1"] = sha1
+                    if progress_tracker:
+                        progress_tracker.update(1, file_info["filename"])
+            finally:
+                if own_executor:
+                    executor.shutdown()
+        
         if progress_tracker:
             progress_tracker.finish(f"Scanned {len(files_info)} files")
 
@@ -159,6 +251,10 @@ def scan_downloads_folder(downloads_path: Optional[str] = None, excluded_files:
         logger.error(f"Permission denied accessing: {path}")
         return []
     
+    if scan_errors:
+        logger.error(f"Error creating file info for {len(scan_errors)} files; first: {scan_errors[0]}")
+        for error in scan_errors[1:]:
+            logger.debug(f"Error creating file info for {error}")
     if incremental and skipped_count > 0:
         logger.info(f"Incremental scan: {skipped_count} unchanged files skipped SHA1 calculation")
     logger.info(f"Scanned {len(files_info)} files in {path}")
@@ -212,10 +308,20 @@ def update_csv_data(existing_data: List[Dict[str, Any]], new_data: List[Dict[str
     return updated_data
 
 
+def _csv_fingerprint(data: List[Dict[str, Any]]) -> List[Tuple[str, str, str, str]]:
+    # Every CSV column is derived from these four fields
+    return [(item["folder_name"], item["filename"], item.get("sha1") or "", item.get("timestamp") or "")
+            for item in data]
+
+
+def records_unchanged(existing_data: List[Dict[str, Any]], new_data: List[Dict[str, Any]]) -> bool:
+    """Check whether saving new_data would rewrite the same rows existing_data was loaded from."""
+    return len(existing_data) == len(new_data) and _csv_fingerprint(existing_data) == _csv_fingerprint(new_data)
+
+
 def save_to_csv(data: List[Dict[str, Any]], csv_path: Optional[str] = None) -> bool:
     """Save data to CSV file."""
     logger = logging.getLogger(__name__)
-    from config_manager import get_config
     downloads_path = Path(get_config().get_downloads_path())
 
     if csv_path is None:
@@ -223,32 +329,33 @@ def save_to_csv(data: List[Dict[str, Any]], csv_path: Optional[str] = None) -> b
     else:
         csv_file = Path(csv_path) if Path(csv_path).is_absolute() else downloads_path / csv_path
 
+    _csv_cache["key"] = None
     try:
         with csv_file.open("w", newline="", encoding="utf-8") as csvfile:
-            fieldnames = ["path", "rel_path", "folder_name", "filename", "sha1sum", "timestamp", "mtime_iso"]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
             writer.writeheader()
             
-            rows = []
-            for item in data:
-                folder_name = item["folder_name"]
-                filename = item['filename']
-                timestamp = item.get('timestamp', '')
-                
-                if folder_name == "~":
-                    path_str, rel_path = f"~\\{filename}", filename
-                else:
-                    path_str, rel_path = f"~\\{folder_name}\\{filename}", f"{folder_name}/{filename}"
-                
-                legacy_timestamp = timestamp[:8].replace('-', '/')[2:] if timestamp else ''
-                
-                rows.append({
-                    "path": path_str, "rel_path": rel_path, "folder_name": folder_name,
-                    "filename": filename, "sha1sum": item.get("sha1", ""),
-                    "timestamp": legacy_timestamp, "mtime_iso": timestamp
-                })
+            def rows():
+                # Yield rows one at a time so the file is written as it is built
+                for item in data:
+                    folder_name = item["folder_name"]
+                    filename = item['filename']
+                    timestamp = item.get('timestamp', '')
+                    
+                    if folder_name == "~":
+                        path_str, rel_path = f"~\\{filename}", filename
+                    else:
+                        path_str, rel_path = f"~\\{folder_name}\\{filename}", f"{folder_name}/{filename}"
+                    
+                    legacy_timestamp = timestamp[:8].replace('-', '/')[2:] if timestamp else ''
+                    
+                    yield {
+                        "path": path_str, "rel_path": rel_path, "folder_name": folder_name,
+                        "filename": filename, "sha1sum": item.get("sha1", ""),
+                        "timestamp": legacy_timestamp, "mtime_iso": timestamp
+                    }
             
-            writer.writerows(rows)
+            writer.writerows(rows())
         
         logger.info(f"Data saved to {csv_file} ({len(data)} records)")
         return True
@@ -264,27 +371,47 @@ def save_to_csv(data: List[Dict[str, Any]], csv_path: Optional[str] = None) -> b
 def load_from_csv(csv_path: Optional[str] = None) -> List[Dict[str, Any]]:
     """Load data from CSV file with backward compatibility."""
     logger = logging.getLogger(__name__)
-    from config_manager import get_config
     downloads_path = Path(get_config().get_downloads_path())
 
     csv_file = Path(csv_path) if csv_path else downloads_path / "results.csv"
 
-    if not csv_file.exists():
-        logger.info(f"CSV file not found: {csv_file}")
-        return []
-
     data = []
     downloads_path_str = str(downloads_path)
     
     try:
+        st = csv_file.stat()
+        cache_key = (str(csv_file), downloads_path_str, st.st_mtime_ns, st.st_size)
+        if _csv_cache["key"] == cache_key:
+            data = list(_csv_cache["rows"])
+            logger.info(f"Loaded {len(data)} records from {csv_file} (cached)")
+            return data
+        
         with csv_file.open("r", newline="", encoding="utf-8") as csvfile:
-            for row in csv.DictReader(csvfile):
-                if "folder_name" in row and "filename" in row:
-                    folder_name, filename = row["folder_name"], row["filename"]
-                    rel_path = row.get("rel_path", "")
-                else:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            # Resolve column positions once
+            columns = {name: i for i, name in enumerate(header)}
+            indices = [columns.get(name) for name in _CSV_READ_FIELDS]
+            legacy = "folder_name" not in columns or "filename" not in columns
+            if None in indices:
+                # Columns absent from the header read as "", whatever extra fields a row carries
+                def get_fields(row):
+                    return [row[i] if i is not None and i < len(row) else "" for i in indices]
+            else:
+                get_fields = itemgetter(*indices)
+            padding = [""] * len(header)
+            
+            for row in reader:
+                if not row:
+                    continue
+                try:
+                    row_path, folder_name, filename, rel_path, sha1, mtime_iso, timestamp = get_fields(row)
+                except IndexError:
+                    # Short row
+                    row_path, folder_name, filename, rel_path, sha1, mtime_iso, timestamp = get_fields(row + padding[len(row):])
+                
+                if legacy:
                     # Legacy format
-                    row_path = row["path"]
                     if row_path.startswith("~\\"):
                         parts = row_path[2:].split("\\")
                         folder_name = "~" if len(parts) == 1 else parts[0]
@@ -298,12 +425,14 @@ def load_from_csv(csv_path: Optional[str] = None) -> List[Dict[str, Any]]:
                 data.append({
                     "root_dir": "~", "folder_name": folder_name, "filename": filename,
                     "full_path": full_path, "rel_path": rel_path,
-                    "sha1": row.get("sha1sum", ""),
-                    "timestamp": row.get("mtime_iso") or row.get("timestamp", ""),
+                    "sha1": sha1, "timestamp": mtime_iso or timestamp,
                 })
         
+        _csv_cache["key"], _csv_cache["rows"] = cache_key, list(data)
         logger.info(f"Loaded {len(data)} records from {csv_file}")
         
+    except FileNotFoundError:
+        logger.info(f"CSV file not found: {csv_file}")
     except PermissionError:
         logger.error(f"Permission denied reading: {csv_file}")
     except Exception as e:
@@ -314,7 +443,6 @@ def load_from_csv(csv_path: Optional[str] = None) -> List[Dict[str, Any]]:
 
 def get_system_info() -> Dict[str, Any]:
     """Get system information for debugging"""
-    from config_manager import get_config
     return {
         "platform": "Windows",
         "platform_version": platform.version(),
@@ -1,11 +1,71 @@
 #!/usr/bin/env python3
 """File organizer module for Windows Downloads folder"""
 
+import errno
 import fnmatch
 import logging
+import os
+import shutil
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 
+_MOVEFILE_COPY_ALLOWED = 0x2
+# link() errors meaning "no hard link possible here" rather than a real failure: other
+# device, or a filesystem without hard links (e.g. FAT/exFAT drives)
+_LINK_UNSUPPORTED = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP}
+
+if sys.platform == "win32":
+    import ctypes
+    _MoveFileExW = ctypes.WinDLL("kernel32", use_last_error=True).MoveFileExW
+    _MoveFileExW.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_uint)
+    _MoveFileExW.restype = ctypes.c_int
+
+
+def _fast_move(src: Path, dst: Path) -> None:
+    """Move a file, using the OS-optimized copy path when src and dst are on different devices.
+    
+    Never replaces an existing dst: a file that appears there after the caller
+    picked the name makes the move fail instead of being overwritten.
+    """
+    if sys.platform == "win32":
+        try:
+            # Like Path.rename, raises FileExistsError if dst exists
+            os.rename(src, dst)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+        # Without MOVEFILE_REPLACE_EXISTING this fails when dst exists
+        if not _MoveFileExW(str(src), str(dst), _MOVEFILE_COPY_ALLOWED):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return
+
+    # POSIX rename() silently replaces dst; link() raises FileExistsError instead
+    try:
+        os.link(src, dst, follow_symlinks=False)
+    except OSError as e:
+        if e.errno not in _LINK_UNSUPPORTED:
+            raise
+    else:
+        try:
+            os.unlink(src)
+        except BaseException:
+            os.unlink(dst)
+            raise
+        return
+
+    # Reserve the name first so copyfile can't overwrite a file that appeared at dst
+    os.close(os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+    try:
+        # copyfile uses sendfile() on Linux instead of a Python read/write loop
+        shutil.copyfile(src, dst)
+        shutil.copystat(src, dst)
+    except BaseException:
+        os.unlink(dst)
+        raise
+    os.unlink(src)
+
 
 class FileOrganizer:
     """Organize files in Downloads folder into categorized subdirectories."""
@@ -33,6 +93,7 @@ class FileOrganizer:
         for category, extensions in self.category_folders.items():
             for ext in extensions:
                 self._ext_to_category[ext] = category
+        self._category_paths = {category: self.downloads_path / category for category in self.category_folders}
     
     def _match_smart_rules(self, filename: str) -> Optional[str]:
         """Match filename against smart rules (pattern-based classification)"""
@@ -50,19 +111,10 @@ class FileOrganizer:
         self.logger.info("Starting file organization...")
         stats = {"total_files": 0, "organized": 0, "skipped": 0, "errors": 0}
         
-        if not dry_run:
-            for folder_name in self.category_folders:
-                folder_path = self.downloads_path / folder_name
-                if not folder_path.exists():
-                    try:
-                        folder_path.mkdir(parents=True, exist_ok=True)
-                        self.logger.info(f"Created folder: {folder_name}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to create folder {folder_name}: {e}")
-        
         try:
-            files_to_organize = [f for f in self.downloads_path.iterdir() 
-                                 if f.is_file() and f.name not in self.excluded_files]
+            with os.scandir(self.downloads_path) as it:
+                files_to_organize = [Path(entry.path) for entry in it
+                                     if entry.is_file() and entry.name not in self.excluded_files]
         except PermissionError:
             self.logger.error(f"Permission denied accessing: {self.downloads_path}")
             return stats
@@ -75,46 +127,65 @@ class FileOrganizer:
         
         self.logger.info(f"Found {len(files_to_organize)} files to organize")
         
+        plan = []
         for source_path in files_to_organize:
             # 优先使用智能规则匹配，其次使用扩展名匹配
             category = self._match_smart_rules(source_path.name) or self._ext_to_category.get(source_path.suffix.lower())
-            
             if category:
-                dest_folder = self.downloads_path / category
-                
-                # Security check
-                if not dest_folder.resolve().is_relative_to(self.downloads_path.resolve()):
-                    self.logger.error(f"Destination outside downloads path. Skipping '{source_path.name}'.")
-                    stats["errors"] += 1
-                    continue
-
-                dest_path = dest_folder / source_path.name
-                
-                # Handle filename conflicts
-                if dest_path.exists():
-                    counter = 1
-                    while dest_path.exists():
-                        dest_path = dest_folder / f"{source_path.stem}_{counter}{source_path.suffix}"
-                        counter += 1
-                
-                if dry_run:
-                    self.logger.info(f"[DRY RUN] Would move '{source_path.name}' to '{category}/'")
-                    stats["organized"] += 1
-                else:
-                    try:
-                        source_path.rename(dest_path)
-                        self.logger.info(f"Moved '{source_path.name}' to '{category}/'")
-                        stats["organized"] += 1
-                    except PermissionError:
-                        self.logger.error(f"Permission denied moving '{source_path.name}'")
-                        stats["errors"] += 1
-                    except Exception as e:
-                        self.logger.error(f"Error moving '{source_path.name}': {e}")
-                        stats["errors"] += 1
+                plan.append((source_path, category))
             else:
                 self.logger.debug(f"No category for '{source_path.name}' - leaving in root")
                 stats["skipped"] += 1
         
+        # Only create the category folders that are about to receive files
+        needed_categories = list(dict.fromkeys(category for _, category in plan))
+        if not dry_run:
+            for category in needed_categories:
+                folder_path = self._category_paths[category]
+                if not folder_path.exists():
+                    try:
+                        folder_path.mkdir(parents=True, exist_ok=True)
+                        self.logger.info(f"Created folder: {category}")
+                    except Exception as e:
+                        self.logger.error(f"Failed to create folder {category}: {e}")
+        
+        # Security check, resolved once per category rather than once per file
+        downloads_root = self.downloads_path.resolve()
+        safe_categories = {category: self._category_paths[category].resolve().is_relative_to(downloads_root)
+                           for category in needed_categories}
+        
+        for source_path, category in plan:
+            dest_folder = self._category_paths[category]
+            
+            if not safe_categories[category]:
+                self.logger.error(f"Destination outside downloads path. Skipping '{source_path.name}'.")
+                stats["errors"] += 1
+                continue
+
+            dest_path = dest_folder / source_path.name
+            
+            # Handle filename conflicts
+            if dest_path.exists():
+                counter = 1
+                while dest_path.exists():
+                    dest_path = dest_folder / f"{source_path.stem}_{counter}{source_path.suffix}"
+                    counter += 1
+            
+            if dry_run:
+                self.logger.info(f"[DRY RUN] Would move '{source_path.name}' to '{category}/'")
+                stats["organized"] += 1
+            else:
+                try:
+                    _fast_move(source_path, dest_path)
+                    self.logger.info(f"Moved '{source_path.name}' to '{category}/'")
+                    stats["organized"] += 1
+                except PermissionError:
+                    self.logger.error(f"Permission denied moving '{source_path.name}'")
+                    stats["errors"] += 1
+                except Exception as e:
+                    self.logger.error(f"Error moving '{source_path.name}': {e}")
+                    stats["errors"] += 1
+        
         self.logger.info(f"Organization completed: {stats['organized']} organized, {stats['skipped']} skipped, {stats['errors']} errors")
         return stats
 
@@ -7,10 +7,15 @@ import logging
 from typing import Optional
 from threading import Lock
 
+_BAR_LENGTH = 30
+
 
 class ProgressTracker:
     """Simple progress tracker with console output"""
     
+    # Every possible bar, indexed by filled length, so redraws don't build strings
+    _BARS = tuple('█' * i + '░' * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1))
+    
     def __init__(self, total: int, description: str = "Processing"):
         self.total = total
         self.current = 0
@@ -22,25 +27,27 @@ class ProgressTracker:
         self.show_progress = self.logger.isEnabledFor(logging.INFO)
     
     def update(self, increment: int = 1, item_name: Optional[str] = None) -> None:
+        if not self.show_progress:
+            # Nothing is drawn, so skip the lock; current is approximate under concurrent updates
+            self.current += increment
+            return
+        
         with self.lock:
             self.current += increment
             
-            if not self.show_progress:
-                return
-            
             current_time = time.time()
             if current_time - self.last_update < 0.1 and self.current < self.total:
                 return
             
             self.last_update = current_time
-            self._display_progress(item_name)
+            self._display_progress(current_time, item_name)
     
-    def _display_progress(self, item_name: Optional[str] = None) -> None:
+    def _display_progress(self, now: float, item_name: Optional[str] = None) -> None:
         if self.total == 0:
             return
         
         percentage = (self.current / self.total) * 100
-        elapsed = time.time() - self.start_time
+        elapsed = now - self.start_time
         
         if self.current > 0:
             eta = (elapsed / self.current) * (self.total - self.current)
@@ -48,9 +55,8 @@ class ProgressTracker:
         else:
             eta_str = "ETA: --"
         
-        bar_length = 30
-        filled_length = int(bar_length * self.current // self.total)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
+        filled_length = min(_BAR_LENGTH, int(_BAR_LENGTH * self.current // self.total))
+        bar = self._BARS[filled_length]
         
         item_str = f" | {item_name}" if item_name else ""
         progress_line = f"\r{self.description}: [{bar}] {percentage:.1f}% ({self.current}/{self.total}) | {eta_str}{item_str}"
@@ -62,10 +68,11 @@ class ProgressTracker:
     def finish(self, message: Optional[str] = None) -> None:
         with self.lock:
             self.current = self.total
-            elapsed = time.time() - self.start_time
+            now = time.time()
+            elapsed = now - self.start_time
             
             if self.show_progress:
-                self._display_progress()
+                self._display_progress(now)
                 self.logger.info(message or f"Completed in {elapsed:.2f}s")
 
 